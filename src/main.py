@@ -3,17 +3,25 @@
 import asyncio
 import os
 import subprocess
+import sys
 import time
-from typing import Any
+from typing import Any, Callable
 from enum import Enum
 
 from agents import Agent, Runner, gen_trace_id, trace
+from agents.mcp.server import MCPServerSseParams
 from agents.model_settings import ModelSettings
+from agents.stream_events import RawResponsesStreamEvent
 
 from openai.types.responses import ResponseTextDeltaEvent
 from mcp_extensions.server_with_notifications import MCPServerSseWithNotifications
 from mcp_extensions.streamable_agent import StreamableAgent
 
+try:
+    import uvloop
+except ImportError:  # Windows, or not installed: keep the stdlib loop
+    uvloop = None
+
 
 # --- MCPServer modes ---
 class MCPServerMode(Enum):
@@ -22,6 +30,37 @@ class MCPServerMode(Enum):
     STREAMABLE_HTTP = "typescript streamable_http"
 
 
+_MODE_TABLE: dict[MCPServerMode, tuple[MCPServerSseParams, str]] = {
+    MCPServerMode.PYTHON_SSE: ({"url": "http://localhost:8000/sse"}, "SSE Server"),
+    MCPServerMode.TYPESCRIPT_SSE: ({"url": "http://localhost:3000/sse"}, "SSE Server"),
+    MCPServerMode.STREAMABLE_HTTP: ({"url": "http://localhost:3000/mcp"}, "Streamable HTTP Server"),
+}
+
+
+# --- Stream relay ---
+_FLUSH_CHUNKS = 16  # deltas buffered before a forced stdout flush
+_FLUSH_INTERVAL = 0.05  # seconds a partial buffer may wait before flushing
+
+
+def _relay_direct(event: ResponseTextDeltaEvent, write: Callable[[str], None]) -> None:
+    """Relay‑injected notification chunk (ResponseTextDeltaEvent directly)."""
+    if event.delta:
+        write(event.delta)
+
+
+def _relay_raw(event: RawResponsesStreamEvent, write: Callable[[str], None]) -> None:
+    """Model‑originated chunk (wrapped in RawResponsesStreamEvent)."""
+    data = event.data
+    if type(data) is ResponseTextDeltaEvent and data.delta:
+        write(data.delta)
+
+
+_HANDLERS: dict[type, Callable[[Any, Callable[[str], None]], None]] = {
+    ResponseTextDeltaEvent: _relay_direct,
+    RawResponsesStreamEvent: _relay_raw,
+}
+
+
 # --- Main logic ---
 async def run(mcp_server: MCPServerSseWithNotifications):
     agent = Agent(
@@ -46,19 +85,34 @@ async def run(mcp_server: MCPServerSseWithNotifications):
 
     streamed_result = streamable_agent.run_streamed(input=message)
 
+    # Buffer deltas; flush on size, newline, or after _FLUSH_INTERVAL
+    loop = asyncio.get_running_loop()
+    buf: list[str] = []
+    flush_handle: asyncio.TimerHandle | None = None
+
+    def flush() -> None:
+        nonlocal flush_handle
+        if flush_handle is not None:
+            flush_handle.cancel()
+            flush_handle = None
+        if buf:
+            sys.stdout.write("".join(buf))
+            sys.stdout.flush()
+            buf.clear()
+
+    def write(text: str) -> None:
+        nonlocal flush_handle
+        buf.append(text)
+        if len(buf) >= _FLUSH_CHUNKS or "\n" in text:
+            flush()
+        elif flush_handle is None:
+            flush_handle = loop.call_later(_FLUSH_INTERVAL, flush)
+
     async for event in streamed_result.stream_events():
-        # relay‑injected notification chunk  (ResponseTextDeltaEvent directly)
-        if isinstance(event, ResponseTextDeltaEvent):
-            if event.delta:
-                print(event.delta, end="", flush=True)
-
-        # model‑originated chunk  (wrapped in RawResponsesStreamEvent)
-        elif (
-            getattr(event, "type", "") == "raw_response_event"
-            and isinstance(getattr(event, "data", None), ResponseTextDeltaEvent)
-            and event.data.delta
-        ):
-            print(event.data.delta, end="", flush=True)
+        handler = _HANDLERS.get(type(event))
+        if handler is not None:
+            handler(event, write)
+    flush()
 
     # --- Standard tool calls ---
     message = "Add these numbers: 7 and 22."
@@ -89,26 +143,13 @@ def start_local_server() -> subprocess.Popen[Any]:
     return process
 
 
-async def create_mcp_server(mode: MCPServerMode) -> MCPServerSseWithNotifications:
-    if mode == MCPServerMode.PYTHON_SSE:
-        return MCPServerSseWithNotifications(
-            params={"url": "http://localhost:8000/sse"},
-            name="SSE Server",
-        )
-    elif mode == MCPServerMode.TYPESCRIPT_SSE:
-        return MCPServerSseWithNotifications(
-            params={"url": "http://localhost:3000/sse"},
-            name="SSE Server",
-        )
-    elif mode == MCPServerMode.STREAMABLE_HTTP:
-        return MCPServerSseWithNotifications(
-            params={"url": "http://localhost:3000/mcp"},
-            name="Streamable HTTP Server",
-        )
+def create_mcp_server(mode: MCPServerMode) -> MCPServerSseWithNotifications:
+    params, name = _MODE_TABLE[mode]
+    return MCPServerSseWithNotifications(params=params, name=name)
 
 
 async def main(mode: MCPServerMode):
-    server_instance = await create_mcp_server(mode)
+    server_instance = create_mcp_server(mode)
     async with server_instance as server:
         trace_id = gen_trace_id()
         with trace(workflow_name="MCP Example", trace_id=trace_id):
@@ -117,7 +158,8 @@ async def main(mode: MCPServerMode):
 
 
 if __name__ == "__main__":
+    run_loop = uvloop.run if uvloop is not None else asyncio.run
     try:
-        asyncio.run(main(mode=MCPServerMode.TYPESCRIPT_SSE))
+        run_loop(main(mode=MCPServerMode.TYPESCRIPT_SSE))
     finally:
         exit(0)
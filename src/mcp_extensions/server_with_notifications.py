@@ -1,13 +1,22 @@
-from typing import Any, AsyncGenerator, Optional
+from typing import Any, AsyncGenerator, Callable, Optional
 from anyio.streams.memory import MemoryObjectReceiveStream
-from anyio import create_memory_object_stream
-import json
+from anyio import WouldBlock, create_memory_object_stream
 import asyncio
 
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
+
 from agents.mcp.server import MCPServerSse, MCPServerSseParams
 from mcp.types import JSONRPCMessage
 from httpx_sse._models import ServerSentEvent
 
+_NOTIF_PREFIX = "notifications/"
+_NPLEN = len(_NOTIF_PREFIX)
+
+_SENTINEL = object()  # end of the merged notification queue
+
 
 class MCPServerSseWithNotifications(MCPServerSse):
     """MCP Server that reads normal + logging notifications."""
@@ -22,7 +31,13 @@ class MCPServerSseWithNotifications(MCPServerSse):
         super().__init__(params, cache_tools_list, name, client_session_timeout_seconds)
 
         self._notification_read_stream: Optional[MemoryObjectReceiveStream[JSONRPCMessage | Exception | ServerSentEvent]] = None
-        self._logging_send_stream, self._logging_read_stream = create_memory_object_stream(0)
+        # Small buffer so the session's logging callback never waits on the consumer
+        self._logging_send_stream, self._logging_read_stream = create_memory_object_stream(64)
+
+        # Both sources are pumped into one queue read by stream_notifications()
+        self._merged_queue: asyncio.Queue[Any] = asyncio.Queue()
+        self._pumps: list[asyncio.Task[None]] = []
+        self._live_pumps = 0
 
     async def connect(self):
         await super().connect()
@@ -34,7 +49,17 @@ class MCPServerSseWithNotifications(MCPServerSse):
         async with streams as (read, _):
             self._notification_read_stream = read
 
+        self._live_pumps = 2
+        self._pumps = [
+            asyncio.create_task(self._pump(read, self._parse_server_message)),
+            asyncio.create_task(self._pump(self._logging_read_stream, None)),
+        ]
+
     async def cleanup(self):
+        for pump in self._pumps:
+            pump.cancel()
+        self._merged_queue.put_nowait(_SENTINEL)
+
         await super().cleanup()
 
         try:
@@ -58,49 +83,16 @@ class MCPServerSseWithNotifications(MCPServerSse):
         if self._notification_read_stream is None:
             raise RuntimeError("Not connected")
 
-        server_stream = self._notification_read_stream.__aiter__()
-        logging_stream = self._logging_read_stream.__aiter__()
-
         try:
             while True:
-                if server_stream is None and logging_stream is None:
-                    yield {"method": "notifications/stream_end"}
-                    return
-
-                if server_stream is not None:
-                    try:
-                        message = await asyncio.wait_for(server_stream.__anext__(), timeout=0.1)
-
-                        if isinstance(message, Exception):
-                            raise message
-
-                        if isinstance(message, ServerSentEvent):
-                            if message.event == "message":
-                                try:
-                                    data = json.loads(message.data)
-                                    if data.get("method", "").startswith("notifications/"):
-                                        yield data
-                                except Exception:
-                                    pass
-                            continue
-
-                        message_dict = message.model_dump()
-                        if message_dict.get("method", "").startswith("notifications/"):
-                            yield message_dict
-
-                    except asyncio.TimeoutError:
-                        pass
-                    except StopAsyncIteration:
-                        server_stream = None
-
-                if logging_stream is not None:
-                    try:
-                        log_notification = await asyncio.wait_for(logging_stream.__anext__(), timeout=0.01)
-                        yield log_notification
-                    except asyncio.TimeoutError:
-                        pass
-                    except StopAsyncIteration:
-                        logging_stream = None
+                item = await self._merged_queue.get()
+                if item is _SENTINEL:
+                    break
+                if isinstance(item, Exception):
+                    raise item
+                yield item
+
+            yield {"method": "notifications/stream_end"}
 
         finally:
             try:
@@ -114,11 +106,56 @@ class MCPServerSseWithNotifications(MCPServerSse):
             except Exception:
                 pass
 
+    async def _pump(
+        self,
+        stream: MemoryObjectReceiveStream[Any],
+        parse: Optional[Callable[[Any], Optional[dict[str, Any]]]],
+    ):
+        """Forward one source stream into the merged queue."""
+        queue = self._merged_queue
+        try:
+            async for item in stream:
+                if parse is not None and not isinstance(item, Exception):
+                    item = parse(item)
+                    if item is None:
+                        continue
+                queue.put_nowait(item)
+        except Exception as exc:
+            queue.put_nowait(exc)
+        finally:
+            self._live_pumps -= 1
+            if not self._live_pumps:
+                queue.put_nowait(_SENTINEL)
+
+    @staticmethod
+    def _parse_server_message(message: JSONRPCMessage | ServerSentEvent) -> Optional[dict[str, Any]]:
+        """Return the notification dict carried by a server message, if any."""
+        if isinstance(message, ServerSentEvent):
+            if message.event == "message":
+                try:
+                    data = json_loads(message.data)
+                    method = data.get("method")
+                    if method is not None and method[:_NPLEN] == _NOTIF_PREFIX:
+                        return data
+                except Exception:
+                    pass
+            return None
+
+        # JSONRPCMessage is a RootModel; peek at the wrapped method
+        # before paying for a full model_dump().
+        method = getattr(getattr(message, "root", message), "method", None)
+        if method is not None and method[:_NPLEN] == _NOTIF_PREFIX:
+            return message.model_dump()
+        return None
+
     async def _handle_logging_notification(self, params: Any):
         notification = {
             "method": "notifications/logging",
             "params": params.model_dump(),
         }
-        await self._logging_send_stream.send(notification)
+        try:
+            self._logging_send_stream.send_nowait(notification)
+        except WouldBlock:
+            await self._logging_send_stream.send(notification)
 
 
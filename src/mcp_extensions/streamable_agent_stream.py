@@ -5,16 +5,19 @@ Realtime 'middle‑man' between an OpenAI‑Agents streamed run and an MCP
 notifications/* SSE feed:
 
 - Process each notification chunk
-    - Surfaces to the UI as a normal delta event
-    - Appended to RunResultStreaming.new_items immediately
-- After appending advance the outer agent once and forward that event.
+    - Surfaces to the UI immediately as a normal delta event
+    - Queued for the next debounced advance (_ADVANCE_DEBOUNCE)
+- Per debounce window, append the queued chunks to
+  RunResultStreaming.new_items as one message, then advance the outer agent
+  once and forward that event.
 """
 
 from __future__ import annotations
 
 import asyncio
-import uuid
-from typing import Any, AsyncGenerator
+import itertools
+from types import MappingProxyType
+from typing import Any, AsyncGenerator, Mapping, Sequence
 
 from openai.types.responses import (
     ResponseContentPartAddedEvent,
@@ -31,7 +34,17 @@ from agents.stream_events import RunItemStreamEvent
 from .server_with_notifications import MCPServerSseWithNotifications
 
 
-_GRACE_TICKS = 5  # 5 × 0.1s of idle‑notification tolerance
+_NOTIFICATION_GRACE = 0.5  # seconds of idle‑notification tolerance after the agent finishes
+_ADVANCE_DEBOUNCE = 0.25  # seconds of chunks folded into one Runner.continue_run
+
+# Shared read‑only defaults for missing payload fields (no per‑event allocation)
+_EMPTY_MAP: Mapping[str, Any] = MappingProxyType({})
+
+# Only these notification kinds can carry text chunks
+_TEXT_NOTIF_METHODS = frozenset({"notifications/message", "notifications/logging"})
+
+# Ids of committed notification messages; process‑wide so histories can merge
+_notif_seq = itertools.count()
 
 
 # ════════════════════════════════════════════════════════════════════════════
@@ -45,6 +58,15 @@ class StreamableAgentStream:
         self._ui_msg_id = "stream_notification"
         self._ui_content_index = 0
 
+        # Chunks streamed to the UI but not yet committed to the run; one
+        # agent advance per debounce window instead of one per chunk
+        self._pending_advance: list[str] = []
+        self._advance_ready: asyncio.Future[None] | None = None
+        self._advance_handle: asyncio.TimerHandle | None = None
+
+        # Source ("agent" / "notif") served first on the last tie; flipped each tie
+        self._tie_first: str | None = None
+
     async def stream_events(self) -> AsyncGenerator[Any, None]:
         agent_stream = self._base_stream.stream_events()
         notif_stream = self._mcp_server.stream_notifications()
@@ -53,65 +75,96 @@ class StreamableAgentStream:
         notif_task = asyncio.create_task(notif_stream.__anext__())
 
         agent_done = notif_done = False
-        idle_after_agent = 0
 
-        while True:
-            active = [t for t in (agent_task, notif_task) if t]
-            if not active:
-                break
+        # Idle grace after the agent finishes: a single timer that cancels the
+        # pending notification read, re‑armed whenever a notification arrives.
+        loop = asyncio.get_running_loop()
+        grace_handle: asyncio.TimerHandle | None = None
+        grace_task: asyncio.Task[Any] | None = None
 
-            done, _ = await asyncio.wait(
-                active, timeout=0.1, return_when=asyncio.FIRST_COMPLETED
-            )
+        try:
+            while True:
+                active = [t for t in (agent_task, notif_task) if t]
+                if not active:
+                    break
+                if self._advance_ready is not None:
+                    active.append(self._advance_ready)
 
-            # Idle timeout after agent is finished
-            if not done:
-                if agent_done and notif_task:
-                    idle_after_agent += 1
-                    if idle_after_agent >= _GRACE_TICKS:
-                        notif_task.cancel()
+                done, _ = await asyncio.wait(active, return_when=asyncio.FIRST_COMPLETED)
+
+                # When both the agent and the notification stream are ready,
+                # alternate which one goes first from tie to tie.
+                ready: list[str] = []
+                if agent_task and agent_task in done:
+                    ready.append("agent")
+                if notif_task and notif_task in done:
+                    ready.append("notif")
+                if len(ready) == 2:
+                    if self._tie_first == "agent":
+                        ready.reverse()
+                    self._tie_first = ready[0]
+
+                for source in ready:
+                    # Events from the agent run itself
+                    if source == "agent":
                         try:
-                            await notif_task
-                        except asyncio.CancelledError:
-                            pass
-                        notif_task = None
-                        notif_done = True
-                continue
-            idle_after_agent = 0
-
-            # Events from the agent run itself
-            if agent_task and agent_task in done:
-                try:
-                    evt = agent_task.result()
-                    yield evt
-                    agent_task = asyncio.create_task(agent_stream.__anext__())
-                except StopAsyncIteration:
-                    agent_task = None
-                    agent_done = True
-
-            # Events from the MCP notification SSE stream
-            if notif_task and notif_task in done:
-                try:
-                    notif = notif_task.result()
-
-                    if notif.get("method") == "notifications/stream_end":
+                            evt = agent_task.result()
+                            yield evt
+                            agent_task = asyncio.create_task(agent_stream.__anext__())
+                        except StopAsyncIteration:
+                            agent_task = None
+                            agent_done = True
+
+                    # Events from the MCP notification SSE stream
+                    elif notif_task.cancelled():
+                        # Grace period elapsed without a new notification
                         notif_task = None
                         notif_done = True
                     else:
-                        async for ui_evt in self._handle_notification(notif):
-                            yield ui_evt
-                        notif_task = asyncio.create_task(notif_stream.__anext__())
-                except StopAsyncIteration:
-                    notif_task = None
-                    notif_done = True
+                        try:
+                            notif = notif_task.result()
 
-            if agent_done and notif_done:
-                break
+                            if notif.get("method") == "notifications/stream_end":
+                                notif_task = None
+                                notif_done = True
+                            else:
+                                async for ui_evt in self._handle_notification(notif):
+                                    yield ui_evt
+                                notif_task = asyncio.create_task(notif_stream.__anext__())
+                        except StopAsyncIteration:
+                            notif_task = None
+                            notif_done = True
+
+                # Debounced agent advance over the chunks received so far
+                if self._advance_ready is not None and self._advance_ready in done:
+                    async for evt in self._do_advance():
+                        yield evt
+
+                if agent_done and notif_done:
+                    break
+
+                if agent_done and notif_task and notif_task is not grace_task:
+                    if grace_handle is not None:
+                        grace_handle.cancel()
+                    grace_task = notif_task
+                    grace_handle = loop.call_later(_NOTIFICATION_GRACE, notif_task.cancel)
+
+            # Chunks still waiting for their debounced advance
+            async for evt in self._do_advance():
+                yield evt
+        finally:
+            if grace_handle is not None:
+                grace_handle.cancel()
+            if self._advance_handle is not None:
+                self._advance_handle.cancel()
 
     async def _handle_notification(
         self, notif: dict[str, Any]
     ) -> AsyncGenerator[Any, None]:
-        """Turn one notification payload into UI + history + agent‑advance."""
+        """Stream one notification's text to the UI and queue it for the agent."""
+        if notif.get("method") not in _TEXT_NOTIF_METHODS:
+            return
+
         for chunk in _extract_text_chunks(notif):
 
             # 1. Stream delta to UI
@@ -152,44 +205,71 @@ class StreamableAgentStream:
             )
             self._ui_content_index += 1  # prepare index for next chunk
 
-            # 2. Append chunk to RunResultStreaming.new_items
-            msg_item = MessageOutputItem(
-                raw_item=ResponseOutputMessage(
-                    id=f"notif_{uuid.uuid4().hex}",
-                    role="assistant",
-                    type="message",
-                    status="completed",
-                    content=[
-                        ResponseOutputText(text=chunk, type="output_text", annotations=[])
-                    ],
-                ),
-                agent=self._base_stream.current_agent,
-            )
-            self._base_stream.new_items.append(msg_item)
-            self._base_stream._event_queue.put_nowait(
-                RunItemStreamEvent(name="message_output_created", item=msg_item)
-            )
+            # 2. Queue the chunk for the next debounced agent advance
+            self._pending_advance.append(chunk)
+            if self._advance_ready is None:
+                loop = asyncio.get_running_loop()
+                self._advance_ready = loop.create_future()
+                self._advance_handle = loop.call_later(
+                    _ADVANCE_DEBOUNCE, self._advance_ready.set_result, None
+                )
+
+    async def _do_advance(self) -> AsyncGenerator[Any, None]:
+        """Commit the queued chunks to the run and advance the agent once."""
+        if self._advance_handle is not None:
+            self._advance_handle.cancel()
+        self._advance_ready = self._advance_handle = None
+        if not self._pending_advance:
+            return
+        chunks, self._pending_advance = self._pending_advance, []
+        msg_id = f"notif_{next(_notif_seq)}"
+
+        # 1. Append the batch to RunResultStreaming.new_items, one text part
+        #    per chunk so the model still sees the chunk boundaries
+        msg_item = MessageOutputItem(
+            raw_item=ResponseOutputMessage(
+                id=msg_id,
+                role="assistant",
+                type="message",
+                status="completed",
+                content=[
+                    ResponseOutputText(text=chunk, type="output_text", annotations=[])
+                    for chunk in chunks
+                ],
+            ),
+            agent=self._base_stream.current_agent,
+        )
+        self._base_stream.new_items.append(msg_item)
+
+        # The run has finished: nobody reads its event queue any more
+        if self._base_stream.is_complete:
+            return
 
-            # 3. Advance the outer agent once and surface that event
-            next_evt = await Runner.continue_run(self._base_stream)
-            if next_evt is not None:
-                yield next_evt
+        # 2. Announce the item and advance the outer agent once
+        self._base_stream._event_queue.put_nowait(
+            RunItemStreamEvent(name="message_output_created", item=msg_item)
+        )
+        next_evt = await Runner.continue_run(self._base_stream)
+        if next_evt is not None:
+            yield next_evt
 
 
 # Helpers
-def _extract_text_chunks(notification: dict[str, Any]) -> list[str]:
+def _extract_text_chunks(notification: dict[str, Any]) -> Sequence[str]:
     """Pull plain‑text chunks out of a `notifications/*` JSON‑RPC payload."""
-    params = notification.get("params", {})
+    params = notification.get("params", _EMPTY_MAP)
 
     # Assistant‑style content array
-    content = params.get("content", [])
+    content = params.get("content", ())
+    if len(content) == 1 and content[0].get("type") == "text":
+        return (content[0].get("text", ""),)  # dominant shape, no list build
     chunks = [c.get("text", "") for c in content if c.get("type") == "text"]
     if chunks:
         return chunks
 
     # Flat {type:"text", text:"…"}
-    data = params.get("data", {})
+    data = params.get("data", _EMPTY_MAP)
     if data.get("type") == "text" and data.get("text"):
-        return [data["text"]]
+        return (data["text"],)
 
-    return []
+    return ()